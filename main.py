@@ -1,9 +1,8 @@
 from src.vrp.utils.getData import GetData
 from src.vrp.algorithm.population import Population
 from src.vrp.algorithm.genetic import Genetic
+from src.vrp.utils.utils import draw_routes, plot_evolution_progress
 import os
-import folium
-import matplotlib.pyplot as plt
 
 DEPOT = "University of Transport and Communications"
 NUM_POINTS = 40
@@ -16,65 +15,6 @@ MAX_GENERATIONS = 1000
 MUTATION_RATE = 0.01
 ELITISM_SIZE = 2
 
-def draw_routes(map_obj, locations, routes):
-    """
-    Draw routes on the map with different colors for each route.
-    
-    Args:
-        map_obj: folium Map object
-        locations: List of (lat, lon) tuples including depot at index 0
-        routes: List of routes, each containing location indices
-    """
-    
-    colors = ['red', 'blue', 'green', 'purple', 'orange', 'darkred', 
-              'darkblue', 'darkgreen', 'cadetblue', 'darkpurple',
-              'pink', 'lightblue', 'lightgreen', 'gray', 'black']
-
-    
-    for i, route in enumerate(routes):
-        route_color = colors[i % len(colors)]
-        route_points = []
-        route_debug = []
-      
-        for loc_idx in route:
-            if loc_idx == -1:
-                actual_loc = locations[0]
-                label = "D"
-            else:
-                # Location indices in chromosome (0, 1, 2...) 
-                # correspond to locations[1], locations[2], locations[3]...
-                actual_loc = locations[loc_idx + 1]
-                label = str(loc_idx)
-            
-            route_points.append(actual_loc)
-            route_debug.append(label)
-        
-        
-        if len(route_points) >= 2:
-            folium.PolyLine(
-                route_points,
-                color=route_color,
-                weight=4,
-                opacity=0.7,
-                tooltip=f'Route {i+1}: {" → ".join(route_debug)}'
-            ).add_to(map_obj)
-
-def plot_evolution_progress(best_history, avg_history):
-    """Plot the evolution of fitness over generations"""
-    plt.figure(figsize=(10, 6))
-    generations = range(len(best_history))
-    
-    plt.plot(generations, best_history, 'b-', label='Best Fitness')
-    plt.plot(generations, avg_history, 'r-', label='Average Fitness')
-    
-    plt.title('Fitness Evolution Over Generations')
-    plt.xlabel('Generation')
-    plt.ylabel('Fitness (Total Distance)')
-    plt.legend()
-    plt.grid(True)
-    
-    return plt
-
 def main():
     print("Starting VRP solution with Genetic Algorithm...")
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -137,12 +77,12 @@ def main():
 
     print("\n---------------------------------------")
     progress = ga.get_progress()
-    plt = plot_evolution_progress(
+    fig = plot_evolution_progress(
         progress["best_fitness_history"], 
         progress["avg_fitness_history"]
     )
     plot_path = os.path.join(static_dir, "fitness_evolution.png")
-    plt.savefig(plot_path)
+    fig.savefig(plot_path)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
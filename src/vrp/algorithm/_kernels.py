@@ -0,0 +1,198 @@
+"""
+Compiled inner loops for the genetic operators.
+
+Kernels operate on int16 gene arrays and are compiled with Numba when it is
+installed. Without Numba they run as plain, serial Python with identical
+results.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator used when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _fill_offspring(outer, inner, point1, point2, out):
+    """
+    Build one offspring of the two-point crossover into `out`.
+
+    The segment [point1, point2) is copied from `inner`, remaining positions
+    are filled with the unused values of `outer` in their original order.
+    A boolean bitmap indexed by gene value marks the copied segment, so
+    `outer` is scanned once and the scan stops as soon as every free
+    position is filled.
+    """
+    length = outer.shape[0]
+    used = np.zeros(length, np.bool_)
+
+    for i in range(point1, point2):
+        out[i] = inner[i]
+        used[inner[i]] = True
+
+    remaining = length - (point2 - point1)
+    position = 0
+    for value in outer:
+        if remaining == 0:
+            break
+        if used[value]:
+            continue
+        if position == point1:
+            position = point2
+        out[position] = value
+        position += 1
+        remaining -= 1
+
+
+@njit(cache=True)
+def two_point_crossover(parent1, parent2, point1, point2):
+    """
+    Perform two-point crossover on two gene arrays.
+
+    Args:
+        parent1 (np.ndarray): Genes of the first parent
+        parent2 (np.ndarray): Genes of the second parent
+        point1 (int): Start of the crossover segment (inclusive)
+        point2 (int): End of the crossover segment (exclusive)
+
+    Returns:
+        tuple: Gene arrays of the two offspring
+    """
+    offspring1 = np.empty_like(parent1)
+    offspring2 = np.empty_like(parent2)
+    _fill_offspring(parent1, parent2, point1, point2, offspring1)
+    _fill_offspring(parent2, parent1, point1, point2, offspring2)
+    return offspring1, offspring2
+
+
+@njit(cache=True)
+def _tour_length(genes, distance_flat, matrix_size, num_locations):
+    """Total distance of the depot-separated tour encoded by `genes`."""
+    total = 0.0
+    previous = 0
+    for gene in genes:
+        current = gene + 1 if gene < num_locations else 0
+        total += distance_flat[previous * matrix_size + current]
+        previous = current
+    total += distance_flat[previous * matrix_size]
+    return total
+
+
+@njit(cache=True)
+def _swap(genes, pos1, pos2):
+    """Swap the values at two positions in place."""
+    genes[pos1], genes[pos2] = genes[pos2], genes[pos1]
+
+
+@njit(cache=True, parallel=True)
+def step_generation(genes_matrix, fitness, distance_flat, matrix_size, num_locations,
+                    elite_indices, parents, cross_points, mutate_flags,
+                    swap_positions, new_genes, new_fitness):
+    """
+    Produce the next generation in a single compiled pass.
+
+    The new population is written into the preallocated `new_genes` and
+    `new_fitness` buffers, which must not alias the current population.
+
+    The chromosomes at `elite_indices` are carried over unchanged. The rest
+    of the population is filled pair by pair: the selected parents are
+    recombined with two-point crossover, every child may undergo swap
+    mutation, and its fitness is computed in place.
+
+    Selection and all random decisions are made up front by the caller, one
+    row per pair (or per child slot for mutation), so the kernel itself is
+    deterministic. Pairs only read the current population and write disjoint
+    rows of the output, so they are spread across cores with prange.
+
+    Args:
+        genes_matrix (np.ndarray): (pop_size, L) genes of the current population
+        fitness (np.ndarray): (pop_size,) fitness of the current population
+        distance_flat (np.ndarray): Flattened (row-major) distance matrix
+        matrix_size (int): Number of rows of the distance matrix
+        num_locations (int): Number of locations (excluding depot)
+        elite_indices (np.ndarray): Rows of the best chromosomes to preserve unchanged
+        parents (np.ndarray): (num_pairs, 2) population rows of parent1 and parent2
+        cross_points (np.ndarray): (num_pairs, 2) sorted crossover points
+        mutate_flags (np.ndarray): (2 * num_pairs,) whether each child is mutated
+        swap_positions (np.ndarray): (2 * num_pairs, 2) positions swapped on mutation
+        new_genes (np.ndarray): (pop_size, L) output buffer for the new genes
+        new_fitness (np.ndarray): (pop_size,) output buffer for the new fitness
+    """
+    pop_size = genes_matrix.shape[0]
+
+    elitism_size = elite_indices.shape[0]
+    for i in range(elitism_size):
+        new_genes[i] = genes_matrix[elite_indices[i]]
+        new_fitness[i] = fitness[elite_indices[i]]
+
+    num_pairs = parents.shape[0]
+    for pair in prange(num_pairs):
+        parent1 = genes_matrix[parents[pair, 0]]
+        parent2 = genes_matrix[parents[pair, 1]]
+        point1 = cross_points[pair, 0]
+        point2 = cross_points[pair, 1]
+
+        for offset in range(2):
+            child = elitism_size + 2 * pair + offset
+            # Second offspring only if there's still room
+            if child >= pop_size:
+                break
+
+            slot = 2 * pair + offset
+            if offset == 0:
+                _fill_offspring(parent1, parent2, point1, point2, new_genes[child])
+            else:
+                _fill_offspring(parent2, parent1, point1, point2, new_genes[child])
+            if mutate_flags[slot]:
+                _swap(new_genes[child], swap_positions[slot, 0], swap_positions[slot, 1])
+            new_fitness[child] = _tour_length(new_genes[child], distance_flat, matrix_size,
+                                              num_locations)
+
+
+@njit(cache=True)
+def order_crossover(parent1, parent2, point1, point2):
+    """
+    Order crossover (OX) of two permutations of non-negative integers.
+
+    The child keeps parent1's segment [point1, point2) and takes the other
+    values in parent2's order. Membership is tracked with a presence mask
+    indexed by value, so the whole child is built in O(L). Raises ValueError
+    if the parents are not permutations of the same values.
+
+    Args:
+        parent1 (np.ndarray): Parent providing the segment
+        parent2 (np.ndarray): Parent providing the order of the other values
+        point1 (int): Start of the segment (inclusive)
+        point2 (int): End of the segment (exclusive)
+
+    Returns:
+        np.ndarray: Genes of the child
+    """
+    length = parent1.shape[0]
+    child = np.empty_like(parent1)
+    present = np.zeros(max(parent1.max(), parent2.max()) + 1, np.bool_)
+
+    for i in range(point1, point2):
+        child[i] = parent1[i]
+        present[parent1[i]] = True
+
+    parent2_length = parent2.shape[0]
+    parent2_index = 0
+    for i in range(length):
+        if point1 <= i < point2:
+            continue
+        while parent2_index < parent2_length and present[parent2[parent2_index]]:
+            parent2_index += 1
+        # Numba does not bounds-check, so running out of values must be caught here
+        if parent2_index == parent2_length:
+            raise ValueError("parents must be permutations of the same values")
+        child[i] = parent2[parent2_index]
+        present[parent2[parent2_index]] = True
+    return child
@@ -1,5 +1,4 @@
-import random
-from copy import deepcopy
+import numpy as np
 
 class Chromosome:
     """
@@ -9,6 +8,8 @@ class Chromosome:
     - Last (m-1) integers (n to n+m-2) are delimiters for vehicle routes
     """
     
+    __slots__ = ('num_locations', 'num_vehicles', 'depot_index', 'genes', 'fitness')
+    
     def __init__(self, num_locations, num_vehicles, genes=None):
         """
         Initialize a chromosome for the VRP.
@@ -16,7 +17,7 @@ class Chromosome:
         Args:
             num_locations (int): Number of locations (excluding depot)
             num_vehicles (int): Number of vehicles
-            genes (list): Optional pre-defined genes. If None, random genes are created.
+            genes (np.ndarray): Optional pre-defined genes. If None, random genes are created.
         """
         self.num_locations = num_locations
         self.num_vehicles = num_vehicles
@@ -24,17 +25,34 @@ class Chromosome:
         
         # Generate genes if none provided
         if genes is None:
-            # Create a list of all locations and delimiters
-            all_values = list(range(num_locations + num_vehicles - 1))
-            # Randomly shuffle the list
-            random.shuffle(all_values)
-            self.genes = all_values
+            # Random permutation of all locations and delimiters
+            self.genes = np.random.permutation(num_locations + num_vehicles - 1).astype(np.int16)
         else:
-            self.genes = genes
+            self.genes = np.asarray(genes, dtype=np.int16)
         
         # Initialize fitness
         self.fitness = None
         
+    @classmethod
+    def from_population(cls, population, index):
+        """
+        Create a chromosome from one row of a population's genes matrix.
+        
+        The genes are copied, so the chromosome stays valid after the
+        population moves on to the next generation.
+        
+        Args:
+            population (Population): Population holding the genes matrix
+            index (int): Row of the genes matrix
+            
+        Returns:
+            Chromosome: Chromosome with the row's genes and fitness
+        """
+        chromosome = cls(population.num_locations, population.num_vehicles,
+                         genes=population.genes_matrix[index].copy())
+        chromosome.fitness = float(population.fitness[index])
+        return chromosome
+        
     def get_routes(self):
         """
         Convert chromosome genes into vehicle routes.
@@ -42,71 +60,48 @@ class Chromosome:
         Returns:
             list: List of routes, each with depot at start and end
         """
-        # Identify delimiter values
-        delimiter_start = self.num_locations
-        delimiter_end = self.num_locations + self.num_vehicles - 1
-        
-        # Copy genes to avoid modifying original
-        positions = deepcopy(self.genes)
-        
-        # Track delimiter positions
-        delimiter_positions = []
-        for i in range(len(positions)):
-            if delimiter_start <= positions[i] < delimiter_end:
-                delimiter_positions.append(i)
+        genes = self.genes
+        # Delimiters are every value >= num_locations
+        delimiter_positions = np.flatnonzero(genes >= self.num_locations)
         
-        # Sort delimiter positions
-        delimiter_positions.sort()
-        
-        # Split genes into routes
-        routes = []
+        # Slice the genes between delimiters and add depot at start and end
+        # of each non-empty route
+        complete_routes = []
         start_idx = 0
-        
-        # Handle each section created by delimiters
-        for pos in delimiter_positions:
-            route = positions[start_idx:pos]
-            # Filter out any delimiter values that may have been included
-            route = [loc for loc in route if loc < self.num_locations]
-            routes.append(route)
+        for pos in [*delimiter_positions, len(genes)]:
+            route = genes[start_idx:pos]
+            if route.size:
+                complete_routes.append([self.depot_index, *route.tolist(), self.depot_index])
             start_idx = pos + 1
         
-        # Handle the last route
-        last_route = positions[start_idx:]
-        last_route = [loc for loc in last_route if loc < self.num_locations]
-        routes.append(last_route)
-        
-        # Add depot at start and end of each route
-        complete_routes = []
-        for route in routes:
-            if route:  # Only add non-empty routes
-                complete_route = [self.depot_index] + route + [self.depot_index]
-                complete_routes.append(complete_route)
-        
         return complete_routes
         
     def calculate_fitness(self, distance_matrix):
         """
         Calculate fitness (total distance) for this chromosome.
         
+        The genes are flattened into a single tour where every delimiter
+        becomes a return to the depot, so the total distance is one gather
+        over consecutive tour stops. Back-to-back depot stops (empty routes)
+        contribute distance_matrix[0][0], which therefore has to be 0.
+        
         Args:
-            distance_matrix (list): Matrix of distances between locations
+            distance_matrix (np.ndarray): Matrix of distances between locations
             
         Returns:
             float: Total distance (lower is better)
         """
-        routes = self.get_routes()
-        total_distance = 0
-        
-        # Calculate distance for each route
-        for route in routes:
-            route_distance = 0
-            for i in range(len(route) - 1):
-                # Convert from depot index (-1) to actual index in distance matrix (0)
-                from_idx = 0 if route[i] == self.depot_index else route[i] + 1
-                to_idx = 0 if route[i + 1] == self.depot_index else route[i + 1] + 1
-                route_distance += distance_matrix[from_idx][to_idx]
-            
-            total_distance += route_distance
+        distance_matrix = np.asarray(distance_matrix)
+        if distance_matrix[0, 0] != 0:
+            raise ValueError("distance_matrix[0][0] (depot to depot) must be 0")
+        
+        # Depot (index 0) at both ends and at every delimiter position,
+        # location i maps to distance matrix index i + 1
+        tour = np.zeros(len(self.genes) + 2, dtype=np.intp)
+        tour[1:-1] = np.where(self.genes < self.num_locations, self.genes + 1, 0)
+        
+        size = distance_matrix.shape[0]
+        total_distance = float(distance_matrix.reshape(-1)[tour[:-1] * size + tour[1:]].sum())
         
         self.fitness = total_distance
         return total_distance
@@ -1,8 +1,7 @@
 from .population import Population
 from .chromosome import Chromosome
-import random
+from ._kernels import two_point_crossover, step_generation
 import numpy as np
-import copy
 import time
 
 class Genetic:
@@ -11,7 +10,7 @@ class Genetic:
     Manages the evolution of a population of chromosomes to find optimal routes.
     """
     def __init__(self, population, max_generations=100, 
-                 mutation_rate=0.1, elitism_size=2):
+                 mutation_rate=0.1, elitism_size=2, seed=None):
         """
         Initialize the Genetic Algorithm.
         
@@ -21,24 +20,67 @@ class Genetic:
             selection_rate (float): Portion of population to select for reproduction
             mutation_rate (float): Probability of mutation for each gene
             elitism_size (int): Number of best chromosomes to preserve unchanged
+            seed (int): Optional seed for the generator driving each generation.
+                If None, the generator is seeded from the global NumPy random
+                state, so np.random.seed() keeps runs reproducible
         """
         self.population = population
         self.max_generations = max_generations
         self.mutation_rate = mutation_rate
         self.elitism_size = elitism_size
+        if seed is None:
+            seed = np.random.randint(2**32, dtype=np.uint32)
+        self.rng = np.random.default_rng(seed)
+        
+        # Buffers the next generation is written into, swapped with the
+        # population's arrays after every generation
+        self._next_genes = np.empty_like(self.population.genes_matrix)
+        self._next_fitness = np.empty_like(self.population.fitness)
         
         # Track progress
         self.current_generation = 0
-        self.best_solution = None
-        self.best_fitness_history = []
-        self.avg_fitness_history = []
+        # History buffers hold one entry per generation plus the initial one
+        self._best_history = np.empty(max_generations + 1, dtype=np.float32)
+        self._avg_history = np.empty(max_generations + 1, dtype=np.float32)
+        self._hist_idx = 0
         
-        best_chrom = self.population.find_best_chromosome()
-        self.best_solution = copy.deepcopy(best_chrom)
-        self.best_fitness_history.append(best_chrom.fitness)
-        self.avg_fitness_history.append(self.population.get_average_fitness())
+        # Best solution is kept as raw genes + fitness, see best_solution
+        best_idx = int(self.population.fitness.argmin())
+        self.best_genes = self.population.genes_matrix[best_idx].copy()
+        self.best_fitness = float(self.population.fitness[best_idx])
+        self._record_history(self.best_fitness, self.population.get_average_fitness())
+    
+    @property
+    def best_fitness_history(self):
+        """Best fitness of each generation so far."""
+        return self._best_history[:self._hist_idx]
+    
+    @property
+    def avg_fitness_history(self):
+        """Average fitness of each generation so far."""
+        return self._avg_history[:self._hist_idx]
+    
+    def _record_history(self, best_fitness, avg_fitness):
+        """Store one generation's fitness, growing the buffers if they are full."""
+        if self._hist_idx == len(self._best_history):
+            self._best_history = np.resize(self._best_history, 2 * self._hist_idx + 1)
+            self._avg_history = np.resize(self._avg_history, 2 * self._hist_idx + 1)
+        self._best_history[self._hist_idx] = best_fitness
+        self._avg_history[self._hist_idx] = avg_fitness
+        self._hist_idx += 1
+    
+    @property
+    def best_solution(self):
+        """Best chromosome found so far."""
+        chromosome = Chromosome(
+            num_locations=self.population.num_locations,
+            num_vehicles=self.population.num_vehicles,
+            genes=self.best_genes.copy()
+        )
+        chromosome.fitness = self.best_fitness
+        return chromosome
         
-    def selection(self):
+    def selection(self, select_count=2):
       """
       Select chromosomes for reproduction using binary tournament selection.
       
@@ -48,24 +90,22 @@ class Genetic:
       3. Choose the one with better fitness (lower total distance)
       4. Repeat until we have enough parents
       
+      All tournaments are drawn and decided at once on the fitness vector.
+      
+      Args:
+          select_count (int): Number of chromosomes to select
+      
       Returns:
-          list: Selected chromosomes for reproduction
+          np.ndarray: Population indices of the selected chromosomes
       """
-      select_count = 2
-      selected = []
+      fitness = self.population.fitness
       
-      # Perform binary tournaments until we have enough selected chromosomes
-      while len(selected) < select_count:
-          # Randomly select two different chromosomes
-          contenders = random.sample(self.population.chromosomes, 2)
-          
-          # Select the one with better fitness (lower value is better)
-          winner = contenders[0] if contenders[0].fitness <= contenders[1].fitness else contenders[1]
-          
-          # Add winner to selected list
-          selected.append(winner)
+      # Randomly select two different chromosomes per tournament
+      contenders = self._distinct_pairs(len(self.population), (select_count,))
+      first, second = contenders[:, 0], contenders[:, 1]
       
-      return selected
+      # Select the one with better fitness (lower value is better)
+      return np.where(fitness[first] <= fitness[second], first, second)
             
     def crossover(self, parent1, parent2):
       """
@@ -88,63 +128,15 @@ class Genetic:
       chromosome_length = len(parent1.genes)
       
       # Step 1: Select two random crossover points
-      point1, point2 = sorted(random.sample(range(chromosome_length), 2))
+      point1, point2 = np.sort(self._distinct_pairs(chromosome_length, ()))
       
-      # Step 2: Create first offspring
-      # Initialize with empty values
-      offspring1_genes = [None] * chromosome_length
-      
-      # Step 2a: Copy the middle segment from parent2 into offspring1
-      for i in range(point1, point2):
-          offspring1_genes[i] = parent2.genes[i]
-      
-      # Step 2b: Keep track of values already inserted to avoid duplicates
-      used_values = set(offspring1_genes[point1:point2])
-      
-      # Step 2c: Fill remaining positions from parent1 (preserving order)
-      parent1_index = 0
-      for i in range(chromosome_length):
-          # Skip positions that are already filled
-          if point1 <= i < point2:
-              continue
-          
-          # Find next unused value from parent1
-          while parent1_index < chromosome_length and parent1.genes[parent1_index] in used_values:
-              parent1_index += 1
-          
-          if parent1_index < chromosome_length:
-              offspring1_genes[i] = parent1.genes[parent1_index]
-              used_values.add(parent1.genes[parent1_index])
-              parent1_index += 1
-      
-      # Step 3: Create second offspring (reverse the roles of parents)
-      # Initialize with empty values
-      offspring2_genes = [None] * chromosome_length
-      
-      # Step 3a: Copy the middle segment from parent1 into offspring2
-      for i in range(point1, point2):
-          offspring2_genes[i] = parent1.genes[i]
-      
-      # Step 3b: Keep track of values already inserted to avoid duplicates
-      used_values = set(offspring2_genes[point1:point2])
-      
-      # Step 3c: Fill remaining positions from parent2 (preserving order)
-      parent2_index = 0
-      for i in range(chromosome_length):
-          # Skip positions that are already filled
-          if point1 <= i < point2:
-              continue
-          
-          # Find next unused value from parent2
-          while parent2_index < chromosome_length and parent2.genes[parent2_index] in used_values:
-              parent2_index += 1
-          
-          if parent2_index < chromosome_length:
-              offspring2_genes[i] = parent2.genes[parent2_index]
-              used_values.add(parent2.genes[parent2_index])
-              parent2_index += 1
+      # Step 2: Copy the middle segment from the other parent and fill the
+      # remaining positions in order (compiled kernel)
+      offspring1_genes, offspring2_genes = two_point_crossover(
+          parent1.genes, parent2.genes, point1, point2
+      )
       
-      # Step 4: Create and return new chromosomes
+      # Step 3: Create and return new chromosomes
       offspring1 = Chromosome(
           num_locations=parent1.num_locations,
           num_vehicles=parent1.num_vehicles,
@@ -180,7 +172,7 @@ class Genetic:
       chromosome_length = len(mutated_genes)
       
       # Select two different random positions
-      pos1, pos2 = random.sample(range(chromosome_length), 2)
+      pos1, pos2 = self._distinct_pairs(chromosome_length, ())
       
       # Swap the values at the selected positions
       mutated_genes[pos1], mutated_genes[pos2] = mutated_genes[pos2], mutated_genes[pos1]
@@ -194,47 +186,75 @@ class Genetic:
       
       return mutated_chromosome
 
+    def _distinct_pairs(self, high, shape):
+      """
+      Draw pairs of distinct integers in [0, high).
+      
+      Args:
+          high (int): Exclusive upper bound of the values
+          shape (tuple): Leading shape; the result has shape shape + (2,)
+      
+      Returns:
+          np.ndarray: Array whose last axis holds two different values
+      """
+      first = self.rng.integers(0, high, size=shape)
+      second = self.rng.integers(0, high - 1, size=shape)
+      second += second >= first
+      return np.stack((first, second), axis=-1)
+
     def create_next_generation(self):
       """
       Create the next generation of chromosomes through selection, crossover, and mutation.
+      
+      The whole generation is built by the compiled step_generation kernel,
+      which applies the same elitism, binary tournament selection, two-point
+      crossover and swap mutation as the individual operators above.
       """
-      sorted_chromosomes = sorted(self.population.chromosomes, key=lambda x: x.fitness)
-      new_population = copy.deepcopy(sorted_chromosomes[:self.elitism_size])
-
-      while len(new_population) < self.population.pop_size:
-          selected = self.selection()
-          if len(selected) < 2:
-              break
-          parent1 = random.choice(selected)
-          parent2 = random.choice(selected)
-          
-          # Crossover
-          offspring1, offspring2 = self.crossover(parent1, parent2)
-          
-          if random.random() < self.mutation_rate:
-              offspring1 = self.mutate(offspring1)
-              
-          offspring1.calculate_fitness(self.population.distance_matrix)
-          new_population.append(offspring1)
-          
-          # Add second offspring if there's still room
-          if len(new_population) < self.population.pop_size:
-              if random.random() < self.mutation_rate:
-                  offspring2 = self.mutate(offspring2)
-                  
-              offspring2.calculate_fitness(self.population.distance_matrix)
-              new_population.append(offspring2)
+      pop_size, chromosome_length = self.population.genes_matrix.shape
+      
+      # Partial selection of the elites, no full sort needed
+      kth = min(self.elitism_size, pop_size - 1)
+      elite_indices = np.argpartition(self.population.fitness, kth)[:self.elitism_size]
+      
+      # Draw every random decision of the generation in bulk
+      num_pairs = (pop_size - len(elite_indices) + 1) // 2
+      winners = self.selection(2 * num_pairs).reshape(num_pairs, 2)
+      # Each parent is drawn from the pair's two tournament winners
+      parent_picks = self.rng.integers(0, 2, size=(num_pairs, 2))
+      parents = np.take_along_axis(winners, parent_picks, axis=1)
+      cross_points = np.sort(self._distinct_pairs(chromosome_length, (num_pairs,)), axis=1)
+      mutate_flags = self.rng.random(2 * num_pairs) < self.mutation_rate
+      swap_positions = self._distinct_pairs(chromosome_length, (2 * num_pairs,))
+      
+      genes_matrix, fitness = self._next_genes, self._next_fitness
+      step_generation(
+          self.population.genes_matrix,
+          self.population.fitness,
+          self.population.Dflat,
+          self.population.matrix_size,
+          self.population.num_locations,
+          elite_indices,
+          parents,
+          cross_points,
+          mutate_flags,
+          swap_positions,
+          genes_matrix,
+          fitness
+      )
       
-      self.population.chromosomes = new_population
+      # Recycle the previous generation's arrays as the next output buffers
+      self._next_genes, self._next_fitness = self.population.genes_matrix, self.population.fitness
+      self.population.set_genes_matrix(genes_matrix, fitness)
       self.current_generation += 1
       
-      # Update 
-      current_best = self.population.find_best_chromosome()
-      if current_best.fitness < self.best_solution.fitness:
-          self.best_solution = copy.deepcopy(current_best)
+      # Update from the fitness vector the kernel just produced
+      best_idx = int(fitness.argmin())
+      current_best_fitness = float(fitness[best_idx])
+      if current_best_fitness < self.best_fitness:
+          self.best_genes = genes_matrix[best_idx].copy()
+          self.best_fitness = current_best_fitness
           
-      self.best_fitness_history.append(current_best.fitness)
-      self.avg_fitness_history.append(self.population.get_average_fitness())
+      self._record_history(current_best_fitness, fitness.mean())
     
     def run(self, verbose=True):
         """
@@ -250,26 +270,25 @@ class Genetic:
         
         if verbose:
             print(f"Starting genetic algorithm with {self.population.pop_size} chromosomes")
-            print(f"Initial best fitness: {self.best_solution.fitness:.2f}")
+            print(f"Initial best fitness: {self.best_fitness:.2f}")
         
         # Evolution loop
         for generation in range(1, self.max_generations + 1):
             self.create_next_generation()
             
             if verbose and generation % 10 == 0:
-                current_best = self.population.find_best_chromosome()
                 elapsed = time.time() - start_time
                 print(f"Generation {generation}/{self.max_generations} - "
-                      f"Best: {current_best.fitness:.2f}, "
-                      f"Avg: {self.population.get_average_fitness():.2f}, "
+                      f"Best: {self.best_fitness_history[-1]:.2f}, "
+                      f"Avg: {self.avg_fitness_history[-1]:.2f}, "
                       f"Time: {elapsed:.2f}s")
         
         if verbose:
             total_time = time.time() - start_time
-            improvement = 1 - (self.best_solution.fitness / self.best_fitness_history[0])
+            improvement = 1 - (self.best_fitness / self.best_fitness_history[0])
             print(f"\nEvolution completed in {total_time:.2f} seconds")
             print(f"Initial best fitness: {self.best_fitness_history[0]:.2f}")
-            print(f"Final best fitness: {self.best_solution.fitness:.2f}")
+            print(f"Final best fitness: {self.best_fitness:.2f}")
             print(f"Improvement: {improvement:.2%}")
         
         return self.best_solution
@@ -284,7 +303,7 @@ class Genetic:
         return {
             "current_generation": self.current_generation,
             "max_generations": self.max_generations,
-            "best_fitness": self.best_solution.fitness,
+            "best_fitness": self.best_fitness,
             "average_fitness": self.population.get_average_fitness(),
             "best_fitness_history": self.best_fitness_history,
             "avg_fitness_history": self.avg_fitness_history
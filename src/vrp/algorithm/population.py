@@ -5,6 +5,10 @@ class Population:
     """
     Population class for Vehicle Routing Problem using Genetic Algorithm.
     Manages a collection of chromosomes representing candidate solutions.
+    
+    Chromosomes are stored as structure-of-arrays: one (pop_size, L) genes
+    matrix and one fitness vector. Chromosome objects are only created on
+    demand, e.g. for printing or rendering routes.
     """
     
     def __init__(self, pop_size, num_locations, num_vehicles, distance_matrix):
@@ -15,36 +19,100 @@ class Population:
             pop_size (int): Size of the population
             num_locations (int): Number of locations (excluding depot)
             num_vehicles (int): Number of vehicles
-            distance_matrix (list): Distance matrix between locations
+            distance_matrix (array-like): Distance matrix between locations
         """
         self.pop_size = pop_size
         self.num_locations = num_locations
         self.num_vehicles = num_vehicles
-        self.distance_matrix = distance_matrix
-        self.chromosomes = []
+        # Contiguous float32 matrix, converted once for every fitness gather
+        self.distance_matrix = np.asarray(distance_matrix, dtype=np.float32, order='C')
+        if np.isnan(self.distance_matrix).any():
+            raise ValueError("distance_matrix contains NaN values")
+        # Empty routes become back-to-back depot stops, which must cost nothing
+        if self.distance_matrix[0, 0] != 0:
+            raise ValueError("distance_matrix[0][0] (depot to depot) must be 0")
+        self.D = self.distance_matrix
+        # Flat view: edge (i, j) is Dflat[i * matrix_size + j], a single 1-D gather
+        self.matrix_size = self.D.shape[0]
+        self.Dflat = self.D.reshape(-1)
+        self.genes_matrix = None
+        self.fitness = None
         
         # Initialize population with random chromosomes
         self.initialize_population()
         
     def initialize_population(self):
         """Create initial random population of chromosomes."""
-        self.chromosomes = []
-        for _ in range(self.pop_size):
-            chromosome = Chromosome(self.num_locations, self.num_vehicles)
-            chromosome.calculate_fitness(self.distance_matrix)
-            self.chromosomes.append(chromosome)
+        chromosome_length = self.num_locations + self.num_vehicles - 1
+        # One random permutation per row
+        random_keys = np.random.random((self.pop_size, chromosome_length))
+        self.genes_matrix = np.argsort(random_keys, axis=1).astype(np.int16)
+        self.evaluate_all()
+    
+    def evaluate_all(self):
+        """
+        Evaluate the fitness of every chromosome in one vectorized call.
+        
+        Each row of genes_matrix is turned into a depot-separated tour, so
+        the whole population is scored with a single gather on the distance
+        matrix.
+        
+        Returns:
+            np.ndarray: Fitness of each chromosome
+        """
+        self.fitness = self.evaluate_genes(self.genes_matrix)
+        return self.fitness
+    
+    def evaluate_genes(self, genes_matrix):
+        """
+        Compute the fitness of every row of a genes matrix.
+        
+        Args:
+            genes_matrix (np.ndarray): (n, L) matrix of chromosome genes
+            
+        Returns:
+            np.ndarray: Fitness of each row
+        """
+        tours = np.zeros((genes_matrix.shape[0], genes_matrix.shape[1] + 2), dtype=np.intp)
+        tours[:, 1:-1] = np.where(genes_matrix < self.num_locations, genes_matrix + 1, 0)
+        return self.Dflat[tours[:, :-1] * self.matrix_size + tours[:, 1:]].sum(axis=1)
+    
+    def set_genes_matrix(self, genes_matrix, fitness):
+        """
+        Replace the population with already evaluated genes.
+        
+        Args:
+            genes_matrix (np.ndarray): (pop_size, L) matrix of chromosome genes
+            fitness (np.ndarray): Fitness of each row of genes_matrix
+        """
+        self.genes_matrix = genes_matrix
+        self.fitness = fitness
+    
+    def get_chromosome(self, index):
+        """
+        Create a Chromosome for one row of the population.
+        
+        Args:
+            index (int): Row of genes_matrix
+            
+        Returns:
+            Chromosome: Chromosome with its own copy of the genes
+        """
+        return Chromosome.from_population(self, index)
+    
+    @property
+    def chromosomes(self):
+        """List of Chromosome objects for the whole population, built on demand."""
+        return [self.get_chromosome(i) for i in range(len(self))]
             
     def find_best_chromosome(self):
         """
         Find the chromosome with the best fitness (lowest distance).
 
         """
-        if not self.chromosomes:
+        if len(self) == 0:
             return None
-        sorted_chromosomes = sorted(self.chromosomes, key=lambda x: x.fitness)
-        best_chromosome = sorted_chromosomes[0]
-        
-        return best_chromosome
+        return self.get_chromosome(int(self.fitness.argmin()))
     
     def get_average_fitness(self):
         """
@@ -53,11 +121,10 @@ class Population:
         Returns:
             float: Average fitness value
         """
-        if not self.chromosomes:
+        if len(self) == 0:
             return 0
             
-        total_fitness = sum(chrom.fitness for chrom in self.chromosomes)
-        return total_fitness / len(self.chromosomes)
+        return float(self.fitness.mean())
     
     def get_fitness_stats(self):
         """
@@ -66,25 +133,26 @@ class Population:
         Returns:
             dict: Dictionary with min, max, avg, std fitness values
         """
-        if not self.chromosomes:
+        if len(self) == 0:
             return {"min": 0, "max": 0, "avg": 0, "std": 0}
             
-        fitness_values = [chrom.fitness for chrom in self.chromosomes]
         return {
-            "min": min(fitness_values),
-            "max": max(fitness_values),
-            "avg": sum(fitness_values) / len(fitness_values),
-            "std": np.std(fitness_values)
+            "min": float(self.fitness.min()),
+            "max": float(self.fitness.max()),
+            "avg": float(self.fitness.mean()),
+            "std": float(self.fitness.std())
         }
     
     def __len__(self):
         """Return the population size."""
-        return len(self.chromosomes)
+        if self.genes_matrix is None:
+            return 0
+        return self.genes_matrix.shape[0]
     
     def __str__(self):
         """String representation of the population."""
         stats = self.get_fitness_stats()
-        return (f"Population Size: {len(self.chromosomes)}\n"
+        return (f"Population Size: {len(self)}\n"
                 f"Best Fitness: {stats['min']:.2f}\n"
                 f"Average Fitness: {stats['avg']:.2f}\n"
                 f"Worst Fitness: {stats['max']:.2f}\n"
@@ -1,10 +1,19 @@
 from geopy.geocoders import Nominatim
-from geopy.distance import geodesic
+from functools import lru_cache
 import folium
-import random
+import numpy as np
 import csv
 import os
 
+EARTH_RADIUS_KM = 6371.009
+
+@lru_cache(maxsize=None)
+def _geocode(location_name):
+    """Look up (lat, lon) of a place name once per process."""
+    geolocator = Nominatim(user_agent="map-example")
+    location = geolocator.geocode(location_name)
+    return location.latitude, location.longitude
+
 class GetData:    
     def __init__(self, location_name="University of Transport and Communications", 
                  num_random_points=10, max_distance_km=10, output_dir="./data/static/"):
@@ -20,18 +29,24 @@ class GetData:
         os.makedirs(output_dir, exist_ok=True)
     
     def fetch_coordinates(self):
-        geolocator = Nominatim(user_agent="map-example")
-        location = geolocator.geocode(self.location_name)
-        self.lat, self.lon = location.latitude, location.longitude
+        self.lat, self.lon = _geocode(self.location_name)
         self.locations = [(self.lat, self.lon)]
         return self.lat, self.lon
     
     def generate_random_point(self, base_lat, base_lon):
-      dist = random.uniform(0, self.max_distance_km)
-      bearing = random.uniform(0, 360)
-      start = (base_lat, base_lon)
-      destination = geodesic(kilometers=dist).destination(point=start, bearing=bearing)
-      return destination.latitude, destination.longitude
+      lats, lons = self.generate_random_points(base_lat, base_lon, 1)
+      return float(lats[0]), float(lons[0])
+    
+    def generate_random_points(self, base_lat, base_lon, n):
+      # Spherical direct geodesic for n random distances/bearings at once
+      dist = np.random.uniform(0, self.max_distance_km, n) / EARTH_RADIUS_KM
+      bearing = np.random.uniform(0, 2 * np.pi, n)
+      lat1, lon1 = np.radians(base_lat), np.radians(base_lon)
+      
+      lat2 = np.arcsin(np.sin(lat1) * np.cos(dist) + np.cos(lat1) * np.sin(dist) * np.cos(bearing))
+      lon2 = lon1 + np.arctan2(np.sin(bearing) * np.sin(dist) * np.cos(lat1),
+                               np.cos(dist) - np.sin(lat1) * np.sin(lat2))
+      return np.degrees(lat2), np.degrees(lon2)
     
     def create_map(self):
         if self.lat is None or self.lon is None:
@@ -50,33 +65,36 @@ class GetData:
             icon=folium.Icon(color="red", icon="flag")
         ).add_to(self.map)
         
-        # Points' markers
+        # Points' markers, all sharing one icon
+        point_icon = folium.Icon(color="blue", icon="info-sign")
         for i, (lat, lon) in enumerate(self.locations[1:], 1):
             folium.Marker(
                 [lat, lon],
                 popup=f"Vị trí {i-1}",
-                icon=folium.Icon(color="blue", icon="info-sign")
+                icon=point_icon
             ).add_to(self.map)
             
     def generate_random_locations(self):
         if self.lat is None or self.lon is None:
             self.fetch_coordinates()
         
-        for i in range(self.num_random_points):
-            r_lat, r_lon = self.generate_random_point(self.lat, self.lon)
-            self.locations.append((r_lat, r_lon))
+        r_lats, r_lons = self.generate_random_points(self.lat, self.lon, self.num_random_points)
+        self.locations.extend(zip(r_lats.tolist(), r_lons.tolist()))
             
         return self.locations
     
     def calculate_distance_matrix(self):
-        n = len(self.locations)
-        self.distance_matrix = [[0.0]*n for _ in range(n)]
+        # Haversine distance between every pair of points in one broadcast
+        coords = np.radians(np.asarray(self.locations, dtype=np.float64))
+        lat, lon = coords[:, 0], coords[:, 1]
+        dlat = lat[None, :] - lat[:, None]
+        dlon = lon[None, :] - lon[:, None]
         
-        for i in range(n):
-            for j in range(n):
-                if i != j:
-                    self.distance_matrix[i][j] = geodesic(self.locations[i], self.locations[j]).km
+        a = np.sin(dlat / 2) ** 2 + np.cos(lat[:, None]) * np.cos(lat[None, :]) * np.sin(dlon / 2) ** 2
+        distances = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+        np.fill_diagonal(distances, 0.0)
         
+        self.distance_matrix = distances.astype(np.float32)
         return self.distance_matrix
     
     def save_map(self, filename="map.html"):
@@ -88,7 +106,7 @@ class GetData:
 
         
     def save_distance_matrix(self, filename="distance_matrix.csv"):
-        if not self.distance_matrix:
+        if len(self.distance_matrix) == 0:
             self.calculate_distance_matrix()
             
         filepath = os.path.join(self.output_dir, filename)
@@ -1,64 +1,162 @@
-import folium
-import matplotlib.pyplot as plt
+# folium and matplotlib are imported inside the functions that use them, so
+# importing this module (e.g. from the solver) does not pay for loading them
+import numpy as np
+
+from ..algorithm._kernels import order_crossover
+
+# Builds each customer marker in the browser; row is [lat, lon, customer number].
+# The icon is created once and shared by every marker.
+_CUSTOMER_MARKER_CALLBACK = """
+(function () {
+    var icon = L.AwesomeMarkers.icon({icon: 'info-sign', markerColor: 'blue', prefix: 'glyphicon'});
+    return function (row) {
+        var marker = L.marker(new L.LatLng(row[0], row[1]), {icon: icon});
+        marker.bindPopup('Customer ' + row[2]);
+        return marker;
+    };
+})()
+"""
+
+# Route colors used by draw_routes, cycled when there are more routes
+_ROUTE_COLORS = ('red', 'blue', 'green', 'purple', 'orange', 'darkred',
+                 'darkblue', 'darkgreen', 'cadetblue', 'darkpurple',
+                 'pink', 'lightblue', 'lightgreen', 'gray', 'black')
+
+# The same colors as RGB, for create_map_with_markers_deckgl
+_ROUTE_RGB = ((255, 0, 0), (0, 0, 255), (0, 128, 0), (128, 0, 128), (255, 165, 0),
+              (139, 0, 0), (0, 0, 139), (0, 100, 0), (95, 158, 160), (91, 57, 107),
+              (255, 192, 203), (173, 216, 230), (144, 238, 144), (128, 128, 128), (0, 0, 0))
 
 def draw_routes(map_obj, locations, routes):
     """
     Draw routes on the map with different colors for each route.
     
+    All routes go into one GeoJSON FeatureCollection, one LineString per
+    route carrying its color and tooltip, which is added to the map as a
+    single folium.GeoJson layer.
+    
     Args:
         map_obj: folium Map object
         locations: List of (lat, lon) tuples including depot at index 0
         routes: List of routes, each containing location indices
     """
+    import folium
     
-    colors = ['red', 'blue', 'green', 'purple', 'orange', 'darkred', 
-              'darkblue', 'darkgreen', 'cadetblue', 'darkpurple',
-              'pink', 'lightblue', 'lightgreen', 'gray', 'black']
+    n_colors = len(_ROUTE_COLORS)
 
+    # GeoJSON positions are [lon, lat]
+    lonlat = np.asarray(locations, dtype=np.float64)[:, ::-1]
+    features = []
     
     for i, route in enumerate(routes):
-        route_color = colors[i % len(colors)]
-        route_points = []
-        route_debug = []
-      
-        for loc_idx in route:
-            if loc_idx == -1:
-                actual_loc = locations[0]
-                label = "D"
-            else:
-                # Location indices in chromosome (0, 1, 2...) 
-                # correspond to locations[1], locations[2], locations[3]...
-                actual_loc = locations[loc_idx + 1]
-                label = str(loc_idx)
-            
-            route_points.append(actual_loc)
-            route_debug.append(label)
+        # Location indices in chromosome (0, 1, 2...) 
+        # correspond to locations[1], locations[2], locations[3]...
+        # and the depot (-1) to locations[0]
+        route_arr = np.asarray(route, dtype=np.int64)
+        if len(route_arr) < 2:
+            continue
         
+        depot_mask = route_arr == -1
+        if depot_mask.any():
+            route_debug = np.where(depot_mask, "D", route_arr.astype("U8"))
+        else:
+            # No depot sentinels: labels are the indices themselves
+            route_debug = route_arr.astype("U8")
         
-        if len(route_points) >= 2:
-            folium.PolyLine(
-                route_points,
-                color=route_color,
-                weight=4,
-                opacity=0.7,
-                tooltip=f'Route {i+1}: {" → ".join(route_debug)}'
-            ).add_to(map_obj)
+        features.append({
+            "type": "Feature",
+            "geometry": {
+                "type": "LineString",
+                "coordinates": lonlat[route_arr + 1].tolist()
+            },
+            "properties": {
+                "color": _ROUTE_COLORS[i % n_colors],
+                "tooltip": f'Route {i+1}: ' + " → ".join(route_debug.tolist())
+            }
+        })
+    
+    if not features:
+        return
+    
+    folium.GeoJson(
+        {"type": "FeatureCollection", "features": features},
+        name="routes",
+        style_function=lambda feature: {
+            "color": feature["properties"]["color"],
+            "weight": 4,
+            "opacity": 0.7
+        },
+        tooltip=folium.GeoJsonTooltip(fields=["tooltip"], labels=False)
+    ).add_to(map_obj)
 
 def plot_evolution_progress(best_history, avg_history):
-    """Plot the evolution of fitness over generations"""
-    plt.figure(figsize=(10, 6))
-    generations = range(len(best_history))
+    """
+    Plot the evolution of fitness over generations
+    
+    The figure is built on its own Agg canvas rather than through pyplot, so
+    it is not kept alive by pyplot's figure registry and is freed as soon as
+    the caller drops it.
+    
+    Args:
+        best_history: Best fitness of each generation
+        avg_history: Average fitness of each generation
+    
+    Returns:
+        matplotlib.figure.Figure: Figure with both fitness curves
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    
+    fig = Figure(figsize=(10, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    best_history = np.asarray(best_history)
+    avg_history = np.asarray(avg_history)
+    generations = np.arange(best_history.size)
+    
+    # Both curves in one call, x range fixed up front
+    ax.set_xlim(0, max(generations.size - 1, 1))
+    ax.plot(generations, best_history, 'b-', generations, avg_history, 'r-')
+    
+    ax.set_title('Fitness Evolution Over Generations')
+    ax.set_xlabel('Generation')
+    ax.set_ylabel('Fitness (Total Distance)')
+    # Fixed location skips the legend's best-placement search
+    ax.legend(['Best Fitness', 'Average Fitness'], loc='upper right')
+    ax.grid(True)
+    
+    return fig
+
+def build_customer_layer(locations, depot_name):
+    """
+    Build a FeatureGroup with the depot and customer markers.
     
-    plt.plot(generations, best_history, 'b-', label='Best Fitness')
-    plt.plot(generations, avg_history, 'r-', label='Average Fitness')
+    A new layer is created on every call, so it can be added to any map.
     
-    plt.title('Fitness Evolution Over Generations')
-    plt.xlabel('Generation')
-    plt.ylabel('Fitness (Total Distance)')
-    plt.legend()
-    plt.grid(True)
+    Args:
+        locations: List of location coordinates [lat, lng]
+        depot_name: Name of the depot location
+    
+    Returns:
+        folium.FeatureGroup: Layer with the depot and customer markers
+    """
+    import folium
+    from folium.plugins import FastMarkerCluster
     
-    return plt
+    layer = folium.FeatureGroup(name="locations")
+    
+    # Add depot marker
+    folium.Marker(
+        locations[0],
+        popup=depot_name,
+        icon=folium.Icon(color="red", icon="flag")
+    ).add_to(layer)
+
+    # Add customer markers as one clustered layer rendered in the browser
+    customers = [[lat, lon, i] for i, (lat, lon) in enumerate(locations[1:], 1)]
+    FastMarkerCluster(data=customers, callback=_CUSTOMER_MARKER_CALLBACK).add_to(layer)
+    
+    return layer
 
 def create_map_with_markers(locations, depot_name):
     """
@@ -71,27 +169,130 @@ def create_map_with_markers(locations, depot_name):
     Returns:
         folium.Map: Map object with markers
     """
+    import folium
+    
     # Create a map centered at the depot
     map_center = folium.Map(location=locations[0], zoom_start=13)
+    build_customer_layer(locations, depot_name).add_to(map_center)
+    
+    return map_center
 
-    # Add depot marker
-    folium.Marker(
-        locations[0],
-        popup=depot_name,
-        icon=folium.Icon(color="red", icon="flag")
-    ).add_to(map_center)
+def create_map_with_markers_deckgl(locations, depot_name, routes=None):
+    """
+    Create a deck.gl map of the depot, customers and optionally routes.
+
+    Alternative to create_map_with_markers for large instances: all points
+    go into one ScatterplotLayer and all routes into one PathLayer, which
+    the browser draws with WebGL instead of one Leaflet element per marker.
+    Requires the optional pydeck package.
+
+    Args:
+        locations: List of location coordinates [lat, lng], depot at index 0
+        depot_name: Name of the depot location
+        routes: Optional list of routes, each containing location indices
+
+    Returns:
+        pydeck.Deck: Deck with the marker and route layers
+    """
+    import pydeck as pdk
+
+    loc_arr = np.asarray(locations, dtype=np.float64)
+    # deck.gl expects [lon, lat] positions
+    positions = loc_arr[:, ::-1].tolist()
 
-    # Add customer markers
-    for i, loc in enumerate(locations[1:], 1):
-        folium.Marker(
-            loc,
-            popup=f"Customer {i}",
-            icon=folium.Icon(color="blue", icon="info-sign")
-        ).add_to(map_center)
-    
-    return map_center    
+    points = [{"position": positions[0], "name": depot_name, "color": [255, 0, 0]}]
+    points += [{"position": position, "name": f"Customer {i}", "color": [0, 0, 255]}
+               for i, position in enumerate(positions[1:], 1)]
+    layers = [pdk.Layer(
+        "ScatterplotLayer",
+        points,
+        get_position="position",
+        get_fill_color="color",
+        get_radius=30,
+        pickable=True
+    )]
 
-def visualize_order_crossover(parent1, parent2):
+    if routes:
+        # Same index convention as draw_routes: -1 is the depot
+        n_colors = len(_ROUTE_RGB)
+        paths = [{"path": loc_arr[np.asarray(route, dtype=np.int64) + 1][:, ::-1].tolist(),
+                  "name": f"Route {i+1}",
+                  "color": list(_ROUTE_RGB[i % n_colors])}
+                 for i, route in enumerate(routes) if len(route) >= 2]
+        layers.append(pdk.Layer(
+            "PathLayer",
+            paths,
+            get_path="path",
+            get_color="color",
+            width_min_pixels=3,
+            pickable=True
+        ))
+
+    return pdk.Deck(
+        layers=layers,
+        initial_view_state=pdk.ViewState(latitude=loc_arr[0, 0], longitude=loc_arr[0, 1], zoom=13),
+        tooltip={"text": "{name}"}
+    )
+
+def _show_or_save(fig, save_path):
+    """
+    Show a figure interactively, or render it straight to PNG.
+    
+    Either way the figure is closed afterwards, so pyplot does not keep
+    it alive across repeated calls.
+    
+    Args:
+        fig: matplotlib Figure to output
+        save_path: PNG file path, or None to call plt.show()
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    
+    try:
+        if save_path is None:
+            plt.show()
+        else:
+            # Render with Agg, bypassing the interactive backend
+            FigureCanvasAgg(fig)
+            fig.savefig(save_path, format='png', dpi=100, bbox_inches='tight')
+    finally:
+        plt.close(fig)
+
+def _draw_cells(ax, values, y, colors, fontsize, alpha=0.7):
+    """
+    Draw a row of unit cells as a single one-row Table artist.
+    
+    The table is laid out in data coordinates, so each cell covers
+    [i, i+1] x [y, y+1] like a unit Rectangle would.
+    
+    Args:
+        ax: matplotlib Axes to draw on
+        values: Cell labels, drawn left to right from x = 0
+        y: Bottom of the row
+        colors: One color per cell, or a single color for the whole row
+        fontsize: Font size of the labels
+        alpha: Cell transparency
+    """
+    from matplotlib.patches import Rectangle
+    from matplotlib.table import Table
+    
+    if isinstance(colors, str):
+        colors = [colors] * len(values)
+    
+    # Same zorder as patches, so the row stacks in drawing order like one
+    table = Table(ax, bbox=[0, y, len(values), 1], zorder=Rectangle.zorder)
+    table.set_transform(ax.transData)
+    for i, (val, color) in enumerate(zip(values, colors)):
+        cell = table.add_cell(0, i, width=1, height=1, text=str(val), loc='center',
+                              facecolor=color, edgecolor=color)
+        cell.set_alpha(alpha)
+    table.auto_set_font_size(False)
+    table.set_fontsize(fontsize)
+    ax.add_table(table)
+
+def visualize_order_crossover(parent1, parent2, save_path=None):
+    import matplotlib.pyplot as plt
+    
     # Chọn đoạn ngẫu nhiên từ 2 đến 5
     a, b = 2, 5
     
@@ -99,112 +300,66 @@ def visualize_order_crossover(parent1, parent2):
     child = [-1] * len(parent1)
     child[a:b] = parent1[a:b]
     
-    # Hiển thị thông tin
-    fig, axes = plt.subplots(5, 1, figsize=(12, 12))
+    # Bảng đánh dấu các giá trị đã có trong con (tra cứu O(1))
+    in_child = bytearray(max(max(parent1), max(parent2)) + 1)
+    for val in child[a:b]:
+        in_child[val] = 1
+    
+    # Màu và nhãn dùng chung cho các bước
+    segment_colors = ['orange' if a <= i < b else 'lightblue' for i in range(len(parent1))]
+    child_labels = [val if val != -1 else "?" for val in child]
+    child_colors = ['orange' if val != -1 else 'white' for val in child]
+    
+    # Tất cả các bước nằm trên một trục, xếp chồng từ trên xuống
+    fig, ax = plt.subplots(figsize=(12, 12))
+    top = 0
+    
+    def add_step(height, title):
+        """Đặt tiêu đề của một bước và trả về đáy của vùng vẽ cao `height`."""
+        nonlocal top
+        ax.text((len(parent1) - 1) / 2, top - 0.5, title, ha='center', va='center', fontsize=16)
+        base = top - 1 - height
+        top = base - 1
+        return base
+    
+    def add_labels(base, labels):
+        for y, label in labels:
+            ax.text(-1, base + y, label, ha='right', va='center', fontsize=14)
     
     # 1. Hiển thị cha mẹ
-    ax = axes[0]
-    for i, val in enumerate(parent1):
-        ax.add_patch(plt.Rectangle((i, 0), 1, 1, fill=True, 
-                                  color='lightblue', alpha=0.7))
-        ax.text(i+0.5, 0.5, str(val), ha='center', va='center', fontsize=14)
-    
-    for i, val in enumerate(parent2):
-        ax.add_patch(plt.Rectangle((i, 1.5), 1, 1, fill=True, 
-                                  color='lightgreen', alpha=0.7))
-        ax.text(i+0.5, 2, str(val), ha='center', va='center', fontsize=14)
-    
-    ax.text(-1, 0.5, 'Cha', ha='right', va='center', fontsize=14)
-    ax.text(-1, 2, 'Mẹ', ha='right', va='center', fontsize=14)
-    ax.set_xlim(-1, len(parent1))
-    ax.set_ylim(0, 3)
-    ax.axis('off')
-    ax.set_title("Bước 1: Cha mẹ ban đầu", fontsize=16)
+    base = add_step(2.5, "Bước 1: Cha mẹ ban đầu")
+    _draw_cells(ax, parent1, base, 'lightblue', 14)
+    _draw_cells(ax, parent2, base + 1.5, 'lightgreen', 14)
+    add_labels(base, [(0.5, 'Cha'), (2, 'Mẹ')])
     
     # 2. Chọn đoạn từ cha
-    ax = axes[1]
-    for i, val in enumerate(parent1):
-        if a <= i < b:
-            ax.add_patch(plt.Rectangle((i, 0), 1, 1, fill=True, 
-                                      color='orange', alpha=0.7))
-        else:
-            ax.add_patch(plt.Rectangle((i, 0), 1, 1, fill=True, 
-                                      color='lightblue', alpha=0.7))
-        ax.text(i+0.5, 0.5, str(val), ha='center', va='center', fontsize=14)
-    
-    for i, val in enumerate(parent2):
-        ax.add_patch(plt.Rectangle((i, 1.5), 1, 1, fill=True, 
-                                  color='lightgreen', alpha=0.7))
-        ax.text(i+0.5, 2, str(val), ha='center', va='center', fontsize=14)
+    base = add_step(4, f"Bước 2: Chọn đoạn từ vị trí {a} đến {b-1} từ cha")
+    _draw_cells(ax, parent1, base, segment_colors, 14)
+    _draw_cells(ax, parent2, base + 1.5, 'lightgreen', 14)
 
     # Vẽ con ban đầu
-    for i in range(len(child)):
-        if child[i] != -1:
-            ax.add_patch(plt.Rectangle((i, 3), 1, 1, fill=True, 
-                                    color='orange', alpha=0.7))
-            ax.text(i+0.5, 3.5, str(child[i]), ha='center', va='center', fontsize=14)
-        else:
-            ax.add_patch(plt.Rectangle((i, 3), 1, 1, fill=True, 
-                                    color='white', alpha=0.7))
-            ax.text(i+0.5, 3.5, "?", ha='center', va='center', fontsize=14)
-    
-    ax.set_xlim(-1, len(parent1))
-    ax.set_ylim(0, 4.5)
-    ax.text(-1, 0.5, 'Cha', ha='right', va='center', fontsize=14)
-    ax.text(-1, 2, 'Mẹ', ha='right', va='center', fontsize=14)
-    ax.text(-1, 3.5, 'Con', ha='right', va='center', fontsize=14)
-    ax.axis('off')
-    ax.set_title(f"Bước 2: Chọn đoạn từ vị trí {a} đến {b-1} từ cha", fontsize=16)
+    _draw_cells(ax, child_labels, base + 3, child_colors, 14)
+    add_labels(base, [(0.5, 'Cha'), (2, 'Mẹ'), (3.5, 'Con')])
     
     # 3. Tìm các phần tử không có trong con từ mẹ
-    fill = [item for item in parent2 if item not in child]
-    ax = axes[2]
+    fill = [item for item in parent2 if not in_child[item]]
+    base = add_step(6, "Bước 3: Xác định các phần tử còn thiếu từ mẹ")
     
-    for i, val in enumerate(parent1):
-        if a <= i < b:
-            ax.add_patch(plt.Rectangle((i, 0), 1, 1, fill=True, 
-                                      color='orange', alpha=0.7))
-        else:
-            ax.add_patch(plt.Rectangle((i, 0), 1, 1, fill=True, 
-                                      color='lightblue', alpha=0.7))
-        ax.text(i+0.5, 0.5, str(val), ha='center', va='center', fontsize=14)
-    
-    for i, val in enumerate(parent2):
-        if val in child:
-            ax.add_patch(plt.Rectangle((i, 1.5), 1, 1, fill=True, 
-                                      color='grey', alpha=0.7))
-        else:
-            ax.add_patch(plt.Rectangle((i, 1.5), 1, 1, fill=True, 
-                                      color='lightgreen', alpha=0.7))
-        ax.text(i+0.5, 2, str(val), ha='center', va='center', fontsize=14)
+    _draw_cells(ax, parent1, base, segment_colors, 14)
+    _draw_cells(ax, parent2, base + 1.5,
+                ['grey' if in_child[val] else 'lightgreen' for val in parent2], 14)
     
     # Vẽ con với đoạn đã chọn
-    for i in range(len(child)):
-        if child[i] != -1:
-            ax.add_patch(plt.Rectangle((i, 3), 1, 1, fill=True, 
-                                      color='orange', alpha=0.7))
-            ax.text(i+0.5, 3.5, str(child[i]), ha='center', va='center', fontsize=14)
-        else:
-            ax.add_patch(plt.Rectangle((i, 3), 1, 1, fill=True, 
-                                      color='white', alpha=0.7))
-            ax.text(i+0.5, 3.5, "?", ha='center', va='center', fontsize=14)
+    _draw_cells(ax, child_labels, base + 3, child_colors, 14)
     
     # Hiển thị các phần tử sẽ được điền
-    fill_rect = plt.Rectangle((0, 5), len(fill), 1, fill=True, 
+    fill_rect = plt.Rectangle((0, base + 5), len(fill), 1, fill=True, 
                              color='lightgreen', alpha=0.7)
     ax.add_patch(fill_rect)
     for i, val in enumerate(fill):
-        ax.text(i+0.5, 5.5, str(val), ha='center', va='center', fontsize=14)
+        ax.text(i+0.5, base + 5.5, str(val), ha='center', va='center', fontsize=14)
     
-    ax.text(-1, 0.5, 'Cha', ha='right', va='center', fontsize=14)
-    ax.text(-1, 2, 'Mẹ', ha='right', va='center', fontsize=14)
-    ax.text(-1, 3.5, 'Con', ha='right', va='center', fontsize=14)
-    ax.text(-1, 5.5, 'Từ mẹ:', ha='right', va='center', fontsize=14)
-    
-    ax.set_xlim(-1, len(parent1))
-    ax.set_ylim(0, 6.5)
-    ax.axis('off')
-    ax.set_title("Bước 3: Xác định các phần tử còn thiếu từ mẹ", fontsize=16)
+    add_labels(base, [(0.5, 'Cha'), (2, 'Mẹ'), (3.5, 'Con'), (5.5, 'Từ mẹ:')])
     
     # 4. Điền các phần tử từ mẹ vào con
     temp_child = child.copy()
@@ -214,76 +369,49 @@ def visualize_order_crossover(parent1, parent2):
             temp_child[i] = fill[j]
             j += 1
     
-    ax = axes[3]
-    for i, val in enumerate(parent1):
-        ax.add_patch(plt.Rectangle((i, 0), 1, 1, fill=True, 
-                                  color='lightblue', alpha=0.7))
-        ax.text(i+0.5, 0.5, str(val), ha='center', va='center', fontsize=14)
+    result_colors = ['orange' if a <= i < b else 'lightgreen' for i in range(len(parent1))]
     
-    for i, val in enumerate(parent2):
-        ax.add_patch(plt.Rectangle((i, 1.5), 1, 1, fill=True, 
-                                  color='lightgreen', alpha=0.7))
-        ax.text(i+0.5, 2, str(val), ha='center', va='center', fontsize=14)
+    base = add_step(4, "Bước 4: Điền các phần tử còn lại từ mẹ vào con")
+    _draw_cells(ax, parent1, base, 'lightblue', 14)
+    _draw_cells(ax, parent2, base + 1.5, 'lightgreen', 14)
     
     # Vẽ con với các phần tử được điền
-    for i, val in enumerate(temp_child):
-        if a <= i < b:
-            ax.add_patch(plt.Rectangle((i, 3), 1, 1, fill=True, 
-                                       color='orange', alpha=0.7))
-        else:
-            ax.add_patch(plt.Rectangle((i, 3), 1, 1, fill=True, 
-                                      color='lightgreen', alpha=0.7))
-        ax.text(i+0.5, 3.5, str(val), ha='center', va='center', fontsize=14)
-    
-    ax.text(-1, 0.5, 'Cha', ha='right', va='center', fontsize=14)
-    ax.text(-1, 2, 'Mẹ', ha='right', va='center', fontsize=14)
-    ax.text(-1, 3.5, 'Con', ha='right', va='center', fontsize=14)
-    
-    ax.set_xlim(-1, len(parent1))
-    ax.set_ylim(0, 4.5)
-    ax.axis('off')
-    ax.set_title("Bước 4: Điền các phần tử còn lại từ mẹ vào con", fontsize=16)
+    _draw_cells(ax, temp_child, base + 3, result_colors, 14)
+    add_labels(base, [(0.5, 'Cha'), (2, 'Mẹ'), (3.5, 'Con')])
     
     # 5. So sánh với kết quả từ hàm
     # Đặt a, b cố định để kết quả giống nhau
     a, b = 2, 5
-    child_fixed = [-1] * len(parent1)
-    child_fixed[a:b] = parent1[a:b]
-    fill_fixed = [item for item in parent2 if item not in child_fixed]
-    j = 0
-    for i in range(len(child_fixed)):
-        if child_fixed[i] == -1:
-            child_fixed[i] = fill_fixed[j]
-            j += 1
+    child_fixed = order_crossover(
+        np.asarray(parent1, dtype=np.int32), np.asarray(parent2, dtype=np.int32), a, b
+    ).tolist()
     
-    ax = axes[4]
     # Hiển thị kết quả cuối cùng
-    ax.add_patch(plt.Rectangle((0, 2), len(parent1), 1, fill=True, 
+    base = add_step(1, "Kết quả cuối cùng")
+    ax.add_patch(plt.Rectangle((0, base), len(parent1), 1, fill=True, 
                               color='yellow', alpha=0.2))
-    for i, val in enumerate(child_fixed):
-        if a <= i < b:
-            ax.add_patch(plt.Rectangle((i, 2), 1, 1, fill=True, 
-                                       color='orange', alpha=0.7))
-        else:
-            ax.add_patch(plt.Rectangle((i, 2), 1, 1, fill=True, 
-                                      color='lightgreen', alpha=0.7))
-        ax.text(i+0.5, 2.5, str(val), ha='center', va='center', fontsize=14)
+    _draw_cells(ax, child_fixed, base, result_colors, 14)
+    add_labels(base, [(0.5, 'Kết quả:')])
     
-    ax.text(-1, 2.5, 'Kết quả:', ha='right', va='center', fontsize=14)
     ax.set_xlim(-1, len(parent1))
-    ax.set_ylim(2, 3.5)
+    ax.set_ylim(top + 0.5, 0)
     ax.axis('off')
-    ax.set_title("Kết quả cuối cùng", fontsize=16)
     
     plt.tight_layout()
-    plt.show()
+    _show_or_save(fig, save_path)
     
     return child_fixed
 
-def visualize_Mutation(offspring):
+def visualize_Mutation(offspring, save_path=None):
     """
     Comprehensive visualization of mutation process
+    
+    Args:
+        offspring: Chromosome genes to mutate
+        save_path: Optional PNG path; if given the figure is saved instead of shown
     """
+    import matplotlib.pyplot as plt
+    
     # Create figure and axes for mutation visualization
     fig, axes = plt.subplots(1, 4, figsize=(16, 4))
     
@@ -291,10 +419,7 @@ def visualize_Mutation(offspring):
     ax = axes[0]
     original = offspring.copy()
     
-    for j, gene in enumerate(original):
-        ax.add_patch(plt.Rectangle((j, 0), 1, 1, fill=True, 
-                                 color='lightgreen', alpha=0.7, edgecolor='black'))
-        ax.text(j+0.5, 0.5, str(gene), ha='center', va='center', fontsize=10)
+    _draw_cells(ax, original, 0, 'lightgreen', 10)
     
     ax.text(-1, 0.5, 'Gốc', ha='right', va='center', fontsize=12)
     ax.set_xlim(-1.5, 8.5)
@@ -306,14 +431,10 @@ def visualize_Mutation(offspring):
     ax = axes[1]
     pos1, pos2 = 1, 5  # Fixed for demonstration
     
-    for j, gene in enumerate(original):
-        color = 'red' if j in [pos1, pos2] else 'lightgreen'
-        ax.add_patch(plt.Rectangle((j, 0), 1, 1, fill=True, 
-                                 color=color, alpha=0.7, edgecolor='black'))
-        ax.text(j+0.5, 0.5, str(gene), ha='center', va='center', fontsize=10)
-        
-        if j in [pos1, pos2]:
-            ax.text(j+0.5, -0.3, '↑', ha='center', va='center', fontsize=16, color='red')
+    _draw_cells(ax, original, 0,
+                ['red' if j in [pos1, pos2] else 'lightgreen' for j in range(len(original))], 10)
+    for j in [pos1, pos2]:
+        ax.text(j+0.5, -0.3, '↑', ha='center', va='center', fontsize=16, color='red')
     
     ax.text(-1, 0.5, 'Chọn', ha='right', va='center', fontsize=12)
     ax.set_xlim(-1.5, 8.5)
@@ -326,11 +447,8 @@ def visualize_Mutation(offspring):
     mutated = original.copy()
     mutated[pos1], mutated[pos2] = mutated[pos2], mutated[pos1]
     
-    for j, gene in enumerate(mutated):
-        color = 'yellow' if j in [pos1, pos2] else 'lightgreen'
-        ax.add_patch(plt.Rectangle((j, 0), 1, 1, fill=True, 
-                                 color=color, alpha=0.7, edgecolor='black'))
-        ax.text(j+0.5, 0.5, str(gene), ha='center', va='center', fontsize=10)
+    _draw_cells(ax, mutated, 0,
+                ['yellow' if j in [pos1, pos2] else 'lightgreen' for j in range(len(mutated))], 10)
     
     # Draw swap arrow
     ax.annotate('', xy=(pos2+0.5, 0.8), xytext=(pos1+0.5, 0.8),
@@ -346,16 +464,9 @@ def visualize_Mutation(offspring):
     ax = axes[3]
     
     # Show before and after
-    for j, gene in enumerate(original):
-        ax.add_patch(plt.Rectangle((j, 1), 1, 1, fill=True, 
-                                 color='lightgreen', alpha=0.7, edgecolor='black'))
-        ax.text(j+0.5, 1.5, str(gene), ha='center', va='center', fontsize=10)
-    
-    for j, gene in enumerate(mutated):
-        color = 'yellow' if j in [pos1, pos2] else 'lightblue'
-        ax.add_patch(plt.Rectangle((j, 0), 1, 1, fill=True, 
-                                 color=color, alpha=0.7, edgecolor='black'))
-        ax.text(j+0.5, 0.5, str(gene), ha='center', va='center', fontsize=10)
+    _draw_cells(ax, original, 1, 'lightgreen', 10)
+    _draw_cells(ax, mutated, 0,
+                ['yellow' if j in [pos1, pos2] else 'lightblue' for j in range(len(mutated))], 10)
     
     ax.text(-1, 1.5, 'Trước', ha='right', va='center', fontsize=12)
     ax.text(-1, 0.5, 'Sau', ha='right', va='center', fontsize=12)
@@ -367,5 +478,112 @@ def visualize_Mutation(offspring):
     fig.suptitle('MUTATION (Đột biến)', fontsize=16, fontweight='bold')
     
     plt.tight_layout()
-    plt.show()
+    _show_or_save(fig, save_path)
 
+class _MutationViz:
+    """
+    Single-row mutation view that is built once and redrawn with blitting.
+    
+    The cells, labels and swap markers are animated artists: update() only
+    changes their colors, texts and positions, restores the cached background
+    and redraws those artists instead of rendering the whole figure again.
+    """
+    
+    def __init__(self, length):
+        """
+        Create the figure and its artists.
+        
+        Args:
+            length: Number of genes shown
+        """
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import PatchCollection
+        from matplotlib.patches import Rectangle
+        
+        self.length = length
+        self.fig, self.ax = plt.subplots(figsize=(max(length, 4), 2))
+        self.ax.set_xlim(-0.5, length + 0.5)
+        self.ax.set_ylim(-0.8, 1.8)
+        self.ax.axis('off')
+        
+        self.cells = PatchCollection([Rectangle((i, 0), 1, 1) for i in range(length)],
+                                     facecolors='lightgreen', edgecolors='black',
+                                     alpha=0.7, animated=True)
+        self.ax.add_collection(self.cells)
+        self.labels = [self.ax.text(i+0.5, 0.5, '', ha='center', va='center',
+                                    fontsize=10, animated=True) for i in range(length)]
+        self.markers = [self.ax.text(0, -0.3, '↑', ha='center', va='center',
+                                     fontsize=16, color='red', animated=True) for _ in range(2)]
+        self.status = self.ax.text(length / 2, 1.4, '', ha='center', va='center',
+                                   fontsize=12, fontweight='bold', animated=True)
+        self.artists = [self.cells, *self.labels, *self.markers, self.status]
+        
+        # The background has to be captured again whenever the canvas is fully redrawn
+        self.background = None
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+        plt.show(block=False)
+        self.fig.canvas.draw()
+    
+    def _on_draw(self, event):
+        """Cache the static background and draw the animated artists on top."""
+        self.background = self.fig.canvas.copy_from_bbox(self.ax.bbox)
+        for artist in self.artists:
+            self.ax.draw_artist(artist)
+    
+    def update(self, offspring, pos1, pos2):
+        """
+        Show the swap mutation of two positions of a chromosome.
+        
+        Args:
+            offspring: Chromosome genes to mutate
+            pos1: First swapped position
+            pos2: Second swapped position
+        
+        Returns:
+            list: Mutated genes
+        """
+        mutated = list(offspring)
+        mutated[pos1], mutated[pos2] = mutated[pos2], mutated[pos1]
+        
+        self.cells.set_facecolor(['yellow' if j in (pos1, pos2) else 'lightgreen'
+                                  for j in range(self.length)])
+        for label, val in zip(self.labels, mutated):
+            label.set_text(str(val))
+        for marker, pos in zip(self.markers, (pos1, pos2)):
+            marker.set_x(pos + 0.5)
+        self.status.set_text(f"Đổi chỗ vị trí {pos1} và {pos2}")
+        
+        canvas = self.fig.canvas
+        canvas.restore_region(self.background)
+        for artist in self.artists:
+            self.ax.draw_artist(artist)
+        canvas.blit(self.ax.bbox)
+        canvas.flush_events()
+        
+        return mutated
+
+_mutation_viz = None
+
+def visualize_mutation_step(offspring, pos1, pos2):
+    """
+    Animate one swap mutation, reusing the same figure across calls.
+    
+    Meant to be called repeatedly, e.g. once per generation with the best
+    chromosome; only the changed artists are redrawn each time. A new figure
+    is created when the chromosome length changes or the old one was closed.
+    
+    Args:
+        offspring: Chromosome genes to mutate
+        pos1: First swapped position
+        pos2: Second swapped position
+    
+    Returns:
+        list: Mutated genes
+    """
+    import matplotlib.pyplot as plt
+    
+    global _mutation_viz
+    if (_mutation_viz is None or _mutation_viz.length != len(offspring)
+            or not plt.fignum_exists(_mutation_viz.fig.number)):
+        _mutation_viz = _MutationViz(len(offspring))
+    return _mutation_viz.update(offspring, pos1, pos2)